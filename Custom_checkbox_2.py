@@ -1,12 +1,22 @@
 
 import sys
+import logging
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-                               QLabel, QPushButton, QButtonGroup, QRadioButton,
-                               QScrollArea, QFrame, QMessageBox, QGridLayout, 
-                               QCheckBox)
-from PySide6.QtCore import Qt, Signal
+                               QLabel, QPushButton, QFrame, QMessageBox, QGridLayout,
+                               QCheckBox, QTableView, QHeaderView, QAbstractItemView)
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
 from PySide6.QtGui import QFont
 from typing import List, Tuple
+from choice_table import ChoiceTableModel, RadioDelegate, show_all_rows
+
+# Checkbox actions are logged at debug level rather than printed on every click
+logger = logging.getLogger(__name__)
+
+# Result label for each choice id (0 = GUI, 1 = Custom)
+_CHOICE_STR = ("GUI", "Custom")
+
+_ROW_HEIGHT = 30  # Fixed height of each table row in pixels
+_MAX_UNSCROLLED_ROWS = 8  # Lists up to this length are shown in full, without scrolling
 
 
 class DynamicStringWidget(QWidget):
@@ -20,10 +30,26 @@ class DynamicStringWidget(QWidget):
     def __init__(self, string_list: List[str], parent=None):
         super().__init__(parent)
         self.string_list = string_list
-        self.button_groups = []  # Store button groups for each string
+        self.model = None  # Selection state for each string, created with the table
+        self.table_view = None
         self.gui_checkbox = None
         self.custom_checkbox = None
         self.updating_checkboxes = False  # Flag to prevent recursive updates
+        self._gui_count = 0  # Rows currently set to GUI
+        self._custom_count = 0  # Rows currently set to Custom
+        self._total = len(string_list)  # Row count never changes after construction
+
+        # Bold header font, built once and shared by both column labels
+        self._header_font = QFont()
+        self._header_font.setBold(True)
+        self._header_font.setPointSize(11)
+
+        # Coalesce bursts of radio toggles into a single checkbox refresh
+        self._recompute_timer = QTimer(self)
+        self._recompute_timer.setSingleShot(True)
+        self._recompute_timer.setInterval(0)
+        self._recompute_timer.timeout.connect(self.update_checkbox_states_from_radios)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -34,24 +60,11 @@ class DynamicStringWidget(QWidget):
         # Main layout
         main_layout = QVBoxLayout()
 
-        # Create scroll area for the string items
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameStyle(QFrame.NoFrame)
-
-        # Content widget for scroll area
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-
-        # Create the table-like layout
+        # Create the table-like layout (the table view scrolls by itself)
         table_frame = self.create_table_layout()
-        content_layout.addWidget(table_frame)
-
-        content_layout.addStretch()  # Add stretch to push items to top
-        scroll_area.setWidget(content_widget)
-
-        # Add scroll area to main layout
-        main_layout.addWidget(scroll_area)
+        main_layout.addWidget(table_frame)
+        if self._total <= _MAX_UNSCROLLED_ROWS:
+            main_layout.addStretch()  # Short tables have a fixed height; keep them at the top
 
         # Create OK button layout (right-aligned)
         button_layout = QHBoxLayout()
@@ -88,25 +101,14 @@ class DynamicStringWidget(QWidget):
         # GUI label
         gui_label = QLabel("GUI")
         gui_label.setAlignment(Qt.AlignCenter)
-        font = QFont()
-        font.setBold(True)
-        font.setPointSize(11)
-        gui_label.setFont(font)
+        gui_label.setFont(self._header_font)
         gui_layout.addWidget(gui_label)
 
-        # GUI checkbox (centered) - NO tristate, just binary
-        gui_checkbox_container = QWidget()
-        gui_checkbox_layout = QHBoxLayout(gui_checkbox_container)
-        gui_checkbox_layout.setContentsMargins(0, 0, 0, 0)
-        gui_checkbox_layout.addStretch()
-
+        # GUI checkbox (centered by the layout) - NO tristate, just binary
         self.gui_checkbox = QCheckBox()
         self.gui_checkbox.setTristate(False)  # Only checked/unchecked states
         self.gui_checkbox.clicked.connect(self.on_gui_checkbox_clicked)  # Use clicked instead of stateChanged
-        gui_checkbox_layout.addWidget(self.gui_checkbox)
-        gui_checkbox_layout.addStretch()
-
-        gui_layout.addWidget(gui_checkbox_container)
+        gui_layout.addWidget(self.gui_checkbox, 0, Qt.AlignHCenter)
         grid_layout.addWidget(gui_container, 0, 1)
 
         # Custom column header
@@ -118,76 +120,65 @@ class DynamicStringWidget(QWidget):
         # Custom label
         custom_label = QLabel("Custom")
         custom_label.setAlignment(Qt.AlignCenter)
-        custom_label.setFont(font)
+        custom_label.setFont(self._header_font)
         custom_layout.addWidget(custom_label)
 
-        # Custom checkbox (centered) - NO tristate, just binary
-        custom_checkbox_container = QWidget()
-        custom_checkbox_layout = QHBoxLayout(custom_checkbox_container)
-        custom_checkbox_layout.setContentsMargins(0, 0, 0, 0)
-        custom_checkbox_layout.addStretch()
-
+        # Custom checkbox (centered by the layout) - NO tristate, just binary
         self.custom_checkbox = QCheckBox()
         self.custom_checkbox.setTristate(False)  # Only checked/unchecked states
         self.custom_checkbox.clicked.connect(self.on_custom_checkbox_clicked)  # Use clicked instead of stateChanged
-        custom_checkbox_layout.addWidget(self.custom_checkbox)
-        custom_checkbox_layout.addStretch()
-
-        custom_layout.addWidget(custom_checkbox_container)
+        custom_layout.addWidget(self.custom_checkbox, 0, Qt.AlignHCenter)
         grid_layout.addWidget(custom_container, 0, 2)
 
-        # Add rows for each string
-        for i, string_item in enumerate(self.string_list, 1):
-            row = i  # Start from row 1 (row 0 is headers)
-
-            # String label
-            string_label = QLabel(string_item)
-            string_label.setStyleSheet("QLabel { font-size: 10pt; }")
-            grid_layout.addWidget(string_label, row, 0)
-
-            # Create button group for this string item
-            button_group = QButtonGroup(self)
-
-            # GUI radio button (centered)
-            gui_radio = QRadioButton()
-            button_group.addButton(gui_radio, 0)
-            gui_radio.toggled.connect(self.on_radio_button_changed)
-
-            # Center the radio button
-            gui_radio_container = QWidget()
-            gui_radio_layout = QHBoxLayout(gui_radio_container)
-            gui_radio_layout.setContentsMargins(0, 0, 0, 0)
-            gui_radio_layout.addStretch()
-            gui_radio_layout.addWidget(gui_radio)
-            gui_radio_layout.addStretch()
-            grid_layout.addWidget(gui_radio_container, row, 1)
-
-            # Custom radio button (centered)
-            custom_radio = QRadioButton()
-            button_group.addButton(custom_radio, 1)
-            custom_radio.toggled.connect(self.on_radio_button_changed)
-
-            # Center the radio button
-            custom_radio_container = QWidget()
-            custom_radio_layout = QHBoxLayout(custom_radio_container)
-            custom_radio_layout.setContentsMargins(0, 0, 0, 0)
-            custom_radio_layout.addStretch()
-            custom_radio_layout.addWidget(custom_radio)
-            custom_radio_layout.addStretch()
-            grid_layout.addWidget(custom_radio_container, row, 2)
-
-            # Store the button group with the associated string
-            self.button_groups.append((string_item, button_group))
+        # Rows live in a model; the view only paints the rows that are visible
+        self.model = ChoiceTableModel(self.string_list, self)
+        self.model.choice_toggled.connect(self.on_radio_button_changed)
+
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+        self.table_view.setItemDelegate(RadioDelegate(self.table_view))
+        self.table_view.horizontalHeader().hide()
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table_view.verticalHeader().hide()
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(_ROW_HEIGHT)
+        self.table_view.setShowGrid(False)
+        self.table_view.setFrameStyle(QFrame.NoFrame)
+        self.table_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_view.setFocusPolicy(Qt.NoFocus)
+
+        if self._total <= _MAX_UNSCROLLED_ROWS:
+            show_all_rows(self.table_view, self._total, _ROW_HEIGHT)
+
+        row_font = self.table_view.font()
+        row_font.setPointSize(10)
+        self.table_view.setFont(row_font)
+
+        # Equal column stretch keeps the header widgets over the view's columns
+        for column in range(3):
+            grid_layout.setColumnStretch(column, 1)
+        grid_layout.addWidget(self.table_view, 1, 0, 1, 3)
 
         return frame
 
-    def on_radio_button_changed(self):
+    @Slot(int, bool)
+    def on_radio_button_changed(self, button_id: int, checked: bool):
         """Called when any radio button changes - update checkbox states accordingly"""
+        # Keep the running counts exact, even during bulk updates
+        delta = 1 if checked else -1
+        if button_id == 0:
+            self._gui_count += delta
+        else:
+            self._custom_count += delta
+
         if self.updating_checkboxes:
             return  # Avoid recursive updates
 
-        self.update_checkbox_states_from_radios()
+        # Restarting a pending timer folds every toggle in this burst into one update
+        self._recompute_timer.start()
 
+    @Slot()
     def update_checkbox_states_from_radios(self):
         """Update checkbox states based on current radio button selections"""
         if self.updating_checkboxes:
@@ -195,55 +186,55 @@ class DynamicStringWidget(QWidget):
 
         self.updating_checkboxes = True
 
-        gui_count = sum(1 for _, bg in self.button_groups if bg.checkedId() == 0)
-        custom_count = sum(1 for _, bg in self.button_groups if bg.checkedId() == 1)
-        total_count = len(self.button_groups)
-
         # Update GUI checkbox - only check if ALL are GUI selected
-        self.gui_checkbox.setChecked(gui_count == total_count)
+        self.gui_checkbox.setChecked(self._gui_count == self._total)
 
         # Update Custom checkbox - only check if ALL are Custom selected
-        self.custom_checkbox.setChecked(custom_count == total_count)
+        self.custom_checkbox.setChecked(self._custom_count == self._total)
 
         self.updating_checkboxes = False
 
-    def on_gui_checkbox_clicked(self):
+    @Slot(bool)
+    def on_gui_checkbox_clicked(self, checked: bool):
         """Handle GUI checkbox click"""
         if self.updating_checkboxes:
             return
 
         self.updating_checkboxes = True
 
-        if self.gui_checkbox.isChecked():
-            print("GUI checkbox checked - selecting all GUI radio buttons")
-            # Select all GUI radio buttons
-            for _, button_group in self.button_groups:
-                button_group.button(0).setChecked(True)
+        if checked:
+            logger.debug("GUI checkbox checked - selecting all GUI radio buttons")
+            # Select all GUI radio buttons in one model update
+            self.model.set_all_choices(0)
+            self._gui_count = self._total
+            self._custom_count = 0
             # Uncheck Custom checkbox
             self.custom_checkbox.setChecked(False)
         else:
-            print("GUI checkbox unchecked - clearing all selections")
+            logger.debug("GUI checkbox unchecked - clearing all selections")
             # Clear all GUI selections
             self.clear_all_selections()
 
         self.updating_checkboxes = False
 
-    def on_custom_checkbox_clicked(self):
+    @Slot(bool)
+    def on_custom_checkbox_clicked(self, checked: bool):
         """Handle Custom checkbox click"""
         if self.updating_checkboxes:
             return
 
         self.updating_checkboxes = True
 
-        if self.custom_checkbox.isChecked():
-            print("Custom checkbox checked - selecting all Custom radio buttons")
-            # Select all Custom radio buttons
-            for _, button_group in self.button_groups:
-                button_group.button(1).setChecked(True)
+        if checked:
+            logger.debug("Custom checkbox checked - selecting all Custom radio buttons")
+            # Select all Custom radio buttons in one model update
+            self.model.set_all_choices(1)
+            self._gui_count = 0
+            self._custom_count = self._total
             # Uncheck GUI checkbox
             self.gui_checkbox.setChecked(False)
         else:
-            print("Custom checkbox unchecked - clearing all selections")
+            logger.debug("Custom checkbox unchecked - clearing all selections")
             # Clear all Custom selections
             self.clear_all_selections()
 
@@ -251,23 +242,18 @@ class DynamicStringWidget(QWidget):
 
     def clear_all_selections(self):
         """Clear all radio button selections"""
-        for _, button_group in self.button_groups:
-            checked_button = button_group.checkedButton()
-            if checked_button:
-                checked_button.setAutoExclusive(False)
-                checked_button.setChecked(False)
-                checked_button.setAutoExclusive(True)
+        self.model.clear_choices()
 
+        # Clearing does not report per-row toggles, so reset the running counts directly
+        self._gui_count = 0
+        self._custom_count = 0
+
+    @Slot()
     def on_ok_clicked(self):
         """Handle OK button click with validation"""
-        # Check if all selections are made
-        unselected_items = []
-        for string_item, button_group in self.button_groups:
-            if button_group.checkedId() == -1:  # -1 means no selection
-                unselected_items.append(string_item)
-
+        # Check if all selections are made (-1 means no selection)
         # If there are unselected items, show warning and return
-        if unselected_items:
+        if -1 in self.model.choices:
             QMessageBox.warning(
                 self, 
                 "Incomplete Selection", 
@@ -283,13 +269,9 @@ class DynamicStringWidget(QWidget):
 
     def get_result(self) -> List[Tuple[str, str]]:
         """Get the current selection as a list of tuples"""
-        result = []
-        for string_item, button_group in self.button_groups:
-            # Get the checked button ID (0 for GUI, 1 for Custom)
-            checked_id = button_group.checkedId()
-            choice = "GUI" if checked_id == 0 else "Custom"
-            result.append((string_item, choice))
-        return result
+        # An unselected row (-1) indexes the last entry, i.e. "Custom" as before
+        return [(string_item, _CHOICE_STR[choice])
+                for string_item, choice in zip(self.string_list, self.model.choices)]
 
 
 def main():
@@ -323,4 +305,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()8
+    main()
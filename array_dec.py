@@ -1,41 +1,102 @@
 import re
+from functools import lru_cache
 
-# Compile regex patterns
-pattern_with_assign = re.compile(r"""
+@lru_cache(maxsize=None)
+def get_c_parser():
+    """
+    Return a tree-sitter C parser, or None when tree-sitter-c is not usable.
+    Optional: with it installed, extract_arrays(..., parse=True) reads
+    declarations from a real C parse (initializers containing "};" are
+    handled correctly).
+    """
+    try:
+        import tree_sitter_c
+        from tree_sitter import Language, Parser
+        return Parser(Language(tree_sitter_c.language()))
+    except (ImportError, TypeError, AttributeError, ValueError):
+        # Missing, or a tree_sitter release with a different binding API
+        return None
+
+# Compile regex pattern: one alternation covers arrays with and without
+# initialization, so the source is scanned once
+pattern_array_decl = re.compile(r"""
 (?P<full_decl>
 \b(?:static|extern)?\s*
 [A-Za-z_][A-Za-z0-9_]*\s*
 (?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*
 (\[\s*\w*\s*\]\s*)+
+(?:
+(?P<init>
 =\s*\{
-[\s\S]*?
+[^}]*+(?:\}(?!;)[^}]*+)*+    # initializer body up to the first "};", matched atomically
 \};
 )
-""", re.VERBOSE | re.MULTILINE)
-
-pattern_without_assign = re.compile(r"""
-(?P<full_decl>
-\b(?:static|extern)?\s*
-[A-Za-z_][A-Za-z0-9_]*\s*
-(?P<name>[A-Za-z_][A-Za-z0-9_]*)\s*
-(\[\s*\w*\s*\]\s*)+
+|
 ;
 )
-""", re.VERBOSE | re.MULTILINE)
+)
+""", re.VERBOSE | re.MULTILINE | re.ASCII)
 
-def extract_arrays(code_str):
+def array_declarator_name(declarator):
+    """Return the name declared by an array declarator node, or None for other declarators"""
+    if declarator.type == "init_declarator":
+        declarator = declarator.child_by_field_name("declarator")
+    # "char *names[4]" is an array of pointers: the array sits under the pointer
+    while declarator is not None and declarator.type == "pointer_declarator":
+        declarator = declarator.child_by_field_name("declarator")
+    if declarator is None or declarator.type != "array_declarator":
+        return None
+    # Multi-dimensional arrays nest one array_declarator per dimension
+    while declarator.type == "array_declarator":
+        declarator = declarator.child_by_field_name("declarator")
+    if declarator.type != "identifier":
+        return None
+    return declarator.text.decode()
+
+def extract_arrays_parsed(tree, source):
     result = {}
-    # Extract arrays with initialization
-    for match in pattern_with_assign.finditer(code_str):
-        arr_name = match.group("name")
-        arr_decl = match.group("full_decl")
-        result[arr_name] = arr_decl
-    # Extract arrays without initialization
-    for match in pattern_without_assign.finditer(code_str):
+    # Walk the whole tree, like the regex scan, so arrays declared inside
+    # function bodies are found too
+    nodes = [tree.root_node]
+    while nodes:
+        node = nodes.pop()
+        if node.type != "declaration":
+            nodes.extend(reversed(node.children))
+            continue
+        for declarator in node.children_by_field_name("declarator"):
+            arr_name = array_declarator_name(declarator)
+            if arr_name:
+                result[arr_name] = source[node.start_byte:node.end_byte].decode()
+    return result
+
+def extract_arrays(code_str, parse=False):
+    """
+    Map each array name to its declaration text, using the regex scan.
+    parse=True opts in to a tree-sitter C parse when it is installed. Its
+    results differ from the scan: every declarator of "int a[3], b[4];" maps
+    to the whole declaration, typedefs are skipped, and arrays are listed
+    in source order.
+    """
+    c_parser = get_c_parser() if parse else None
+    if c_parser is not None:
+        source = code_str.encode()
+        tree = c_parser.parse(source)
+        # Sources that are not valid C fall back to the regex scan below
+        if not tree.root_node.has_error:
+            return extract_arrays_parsed(tree, source)
+
+    initialized = {}
+    uninitialized = {}
+    # Extract arrays with or without initialization
+    for match in pattern_array_decl.finditer(code_str):
         arr_name = match.group("name")
         arr_decl = match.group("full_decl")
-        result[arr_name] = arr_decl
-    return result
+        target = initialized if match.group("init") else uninitialized
+        target[arr_name] = arr_decl
+    # Same order and precedence as scanning each form separately: initialized
+    # arrays first, and an uninitialized declaration replaces one of the same name
+    initialized.update(uninitialized)
+    return initialized
 
 # Example usage:
 code = """
@@ -0,0 +1,125 @@
+"""
+Shared model, delegate and view sizing helper for the GUI/Custom choice tables.
+A QTableView with these shows one row per string without creating any per-row widgets.
+"""
+from array import array
+from PySide6.QtWidgets import QApplication, QStyledItemDelegate, QStyle, QStyleOptionButton
+from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex, QEvent, QSize
+from typing import List
+
+
+class ChoiceTableModel(QAbstractTableModel):
+    """
+    Table model holding one GUI/Custom choice per string.
+    Column 0 is the string, columns 1 and 2 are the GUI and Custom choices.
+    """
+    # Emitted with (choice id, checked) for every choice set or cleared,
+    # mirroring QButtonGroup.idToggled
+    choice_toggled = Signal(int, bool)
+
+    def __init__(self, string_list: List[str], parent=None):
+        super().__init__(parent)
+        self.strings = list(string_list)
+        # One signed byte per string: -1 = none, 0 = GUI, 1 = Custom
+        self.choices = array('b', [-1]) * len(self.strings)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.strings)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 3
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if column == 0:
+            if role == Qt.DisplayRole:
+                return self.strings[row]
+        elif role == Qt.CheckStateRole:
+            return Qt.Checked if self.choices[row] == column - 1 else Qt.Unchecked
+        return None
+
+    def flags(self, index):
+        if index.isValid() and index.column() > 0:
+            return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        """Select the clicked choice; like a radio button it cannot be unchecked"""
+        if role != Qt.CheckStateRole or index.column() == 0 or value != Qt.Checked:
+            return False
+        self.set_choice(index.row(), index.column() - 1)
+        return True
+
+    def set_strings(self, string_list: List[str]):
+        """Replace the strings, clearing every choice"""
+        self.beginResetModel()
+        self.strings = list(string_list)
+        self.choices = array('b', [-1]) * len(self.strings)
+        self.endResetModel()
+
+    def set_choice(self, row: int, choice: int):
+        """Set the choice for one row (0 = GUI, 1 = Custom)"""
+        previous = self.choices[row]
+        if previous == choice:
+            return
+        self.choices[row] = choice
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 2), [Qt.CheckStateRole])
+        if previous != -1:
+            self.choice_toggled.emit(previous, False)
+        self.choice_toggled.emit(choice, True)
+
+    def set_all_choices(self, choice: int):
+        """
+        Set every row to the same choice with a single change notification.
+        No per-row choice_toggled is emitted, callers update their own counts.
+        """
+        self.choices = array('b', [choice]) * len(self.strings)
+        if self.strings:
+            self.dataChanged.emit(self.index(0, 1), self.index(len(self.strings) - 1, 2),
+                                  [Qt.CheckStateRole])
+
+    def clear_choices(self):
+        """Clear every row's choice with a single change notification"""
+        self.set_all_choices(-1)
+
+
+class RadioDelegate(QStyledItemDelegate):
+    """
+    Paints the GUI/Custom cells as the style's radio indicator and turns
+    left clicks into choices.
+    """
+
+    def paint(self, painter, option, index):
+        if index.column() == 0:
+            super().paint(painter, option, index)
+            return
+
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        indicator_size = QSize(style.pixelMetric(QStyle.PM_ExclusiveIndicatorWidth),
+                               style.pixelMetric(QStyle.PM_ExclusiveIndicatorHeight))
+
+        radio_option = QStyleOptionButton()
+        radio_option.rect = QStyle.alignedRect(option.direction, Qt.AlignCenter,
+                                               indicator_size, option.rect)
+        radio_option.state = QStyle.State_Enabled
+        if index.data(Qt.CheckStateRole) == Qt.Checked:
+            radio_option.state |= QStyle.State_On
+        else:
+            radio_option.state |= QStyle.State_Off
+        style.drawPrimitive(QStyle.PE_IndicatorRadioButton, radio_option, painter, widget)
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if (index.column() > 0 and event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton):
+            return model.setData(index, Qt.Checked, Qt.CheckStateRole)
+        return False
+
+
+def show_all_rows(view, row_count: int, row_height: int):
+    """Fix a view's height to fit row_count rows and turn its scrollbars off"""
+    view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    view.setFixedHeight(row_count * row_height)
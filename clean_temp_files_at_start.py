@@ -1,7 +1,8 @@
 import os
+import re
 import sys
 import tempfile
-import glob
+import fnmatch
 from shutil import rmtree
 import atexit
 from pathlib import Path
@@ -32,27 +33,35 @@ class AppSpecificTempCleanup:
             # Get the parent directory of current MEI folder
             temp_path = os.path.dirname(self.current_mei_path)
             
-            # Find all MEI folders in temp directory
-            mei_pattern = os.path.join(temp_path, '_MEI*')
-            mei_folders = glob.glob(mei_pattern)
+            # Walk the temp directory once; DirEntry already knows each entry's type
+            with os.scandir(temp_path) as entries:
+                stale_folders = [
+                    entry.path for entry in entries
+                    # Only MEI folders, and never the current one
+                    if entry.name.startswith('_MEI')
+                    and entry.path != self.current_mei_path
+                    and entry.is_dir(follow_symlinks=False)
+                ]
             
-            for mei_folder in mei_folders:
-                # Skip current MEI folder
-                if mei_folder == self.current_mei_path:
-                    continue
-                
-                try:
-                    # Try to remove the folder - if it fails, another instance is using it
-                    rmtree(mei_folder)
-                    print(f"Cleaned up old MEI folder: {os.path.basename(mei_folder)}")
-                except (OSError, PermissionError):
-                    # Folder is in use by another instance or system, skip it
-                    pass
+            # Removed one at a time: this runs from atexit, where thread pools
+            # can no longer be started
+            for mei_folder in stale_folders:
+                self._safe_rmtree(mei_folder)
                     
         except Exception as e:
             # Silently handle any errors - cleanup shouldn't crash the app
             pass
     
+    def _safe_rmtree(self, mei_folder):
+        """Remove one MEI folder, skipping it if it is still in use."""
+        try:
+            # Try to remove the folder - if it fails, another instance is using it
+            rmtree(mei_folder)
+            print(f"Cleaned up old MEI folder: {os.path.basename(mei_folder)}")
+        except (OSError, PermissionError):
+            # Folder is in use by another instance or system, skip it
+            pass
+    
     def cleanup_app_temp_files(self):
         """Clean up temporary files that might be created by your application."""
         try:
@@ -65,16 +74,24 @@ class AppSpecificTempCleanup:
                 # Add more patterns specific to your app's temp file creation
             ]
             
-            for pattern in app_temp_patterns:
-                temp_pattern = os.path.join(self.temp_dir, pattern)
-                for temp_file in glob.glob(temp_pattern):
+            # Fold the patterns into one regex so the temp directory is listed only once
+            # (normcase keeps glob's case-insensitive matching on Windows)
+            app_temp_regex = re.compile('|'.join(
+                fnmatch.translate(os.path.normcase(pattern)) for pattern in app_temp_patterns
+            ))
+            
+            with os.scandir(self.temp_dir) as entries:
+                for entry in entries:
+                    if not app_temp_regex.match(os.path.normcase(entry.name)):
+                        continue
+                    
                     try:
-                        if os.path.isfile(temp_file):
-                            os.remove(temp_file)
-                            print(f"Cleaned up temp file: {os.path.basename(temp_file)}")
-                        elif os.path.isdir(temp_file):
-                            rmtree(temp_file)
-                            print(f"Cleaned up temp directory: {os.path.basename(temp_file)}")
+                        if entry.is_file():
+                            os.remove(entry.path)
+                            print(f"Cleaned up temp file: {entry.name}")
+                        elif entry.is_dir(follow_symlinks=False):
+                            rmtree(entry.path)
+                            print(f"Cleaned up temp directory: {entry.name}")
                     except (OSError, PermissionError):
                         # File might be in use, skip it
                         pass
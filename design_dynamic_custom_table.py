@@ -1,12 +1,22 @@
 
 import sys
+from operator import methodcaller
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
                                QLabel, QPushButton, QButtonGroup, QRadioButton,
                                QScrollArea, QFrame, QMessageBox, QGridLayout)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QFont
 from typing import List, Tuple
 
+# Result label for each button id (0 = GUI, 1 = Custom)
+_CHOICES = ("GUI", "Custom")
+
+# Row radio styling, applied once on the table frame instead of on every radio
+_RADIO_QSS = "QRadioButton { margin-left: 50%; margin-right: 50%; }"
+
+# Calls checkedId() on a button group, so map() can do the per-row call in C
+_CHECKED_ID = methodcaller("checkedId")
+
 
 class DynamicStringWidget(QWidget):
     """
@@ -19,7 +29,9 @@ class DynamicStringWidget(QWidget):
     def __init__(self, string_list: List[str], parent=None):
         super().__init__(parent)
         self.string_list = string_list
-        self.button_groups = []  # Store button groups for each string
+        # Parallel lists: the string and the button group of each row
+        self._strings = []
+        self._groups = []
         self.setup_ui()
 
     def setup_ui(self):
@@ -65,6 +77,7 @@ class DynamicStringWidget(QWidget):
         """Create a table-like layout with headers and radio buttons"""
         frame = QFrame()
         frame.setFrameStyle(QFrame.StyledPanel)
+        frame.setStyleSheet(_RADIO_QSS)
 
         # Use QGridLayout for table-like appearance
         grid_layout = QGridLayout(frame)
@@ -101,28 +114,28 @@ class DynamicStringWidget(QWidget):
 
             # GUI radio button (centered)
             gui_radio = QRadioButton()
-            gui_radio.setStyleSheet("QRadioButton { margin-left: 50%; margin-right: 50%; }")
             button_group.addButton(gui_radio, 0)
             grid_layout.addWidget(gui_radio, row, 1, Qt.AlignCenter)
 
             # Custom radio button (centered)
             custom_radio = QRadioButton()
-            custom_radio.setStyleSheet("QRadioButton { margin-left: 50%; margin-right: 50%; }")
             button_group.addButton(custom_radio, 1)
             grid_layout.addWidget(custom_radio, row, 2, Qt.AlignCenter)
 
-            # Store the button group with the associated string
-            self.button_groups.append((string_item, button_group))
+            # Store the button group alongside its string
+            self._strings.append(string_item)
+            self._groups.append(button_group)
 
         return frame
 
+    @Slot()
     def on_ok_clicked(self):
         """Handle OK button click with validation"""
         # Check if all selections are made
-        unselected_items = []
-        for string_item, button_group in self.button_groups:
-            if button_group.checkedId() == -1:  # -1 means no selection
-                unselected_items.append(string_item)
+        unselected_items = [string_item  # -1 means no selection
+                            for string_item, checked_id in zip(self._strings,
+                                                               map(_CHECKED_ID, self._groups))
+                            if checked_id == -1]
 
         # If there are unselected items, show warning and return
         if unselected_items:
@@ -141,13 +154,10 @@ class DynamicStringWidget(QWidget):
 
     def get_result(self) -> List[Tuple[str, str]]:
         """Get the current selection as a list of tuples"""
-        result = []
-        for string_item, button_group in self.button_groups:
-            # Get the checked button ID (0 for GUI, 1 for Custom)
-            checked_id = button_group.checkedId()
-            choice = "GUI" if checked_id == 0 else "Custom"
-            result.append((string_item, choice))
-        return result
+        # The checked button ID (0 for GUI, 1 for Custom) indexes the label;
+        # -1 (no selection) indexes "Custom", as before
+        return [(string_item, _CHOICES[checked_id])
+                for string_item, checked_id in zip(self._strings, map(_CHECKED_ID, self._groups))]
 
 
 def main():
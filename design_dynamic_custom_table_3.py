@@ -1,11 +1,173 @@
 
 import sys
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-                               QLabel, QPushButton, QButtonGroup, QRadioButton,
-                               QScrollArea, QFrame, QMessageBox, QGridLayout)
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
+                               QLabel, QPushButton, QMessageBox, QTableView,
+                               QHeaderView, QAbstractItemView, QStyle)
+from PySide6.QtCore import Qt, Signal, QSize, QRectF
+from PySide6.QtGui import QFont, QColor, QPixmap, QPainter, QPen
 from typing import List, Tuple
+from choice_table import ChoiceTableModel, RadioDelegate
+
+# Choice label by button id (0 = GUI, 1 = Custom)
+_CHOICES = ("GUI", "Custom")
+
+# Title font, built once and shared by every instance
+_TITLE_FONT = QFont()
+_TITLE_FONT.setPointSize(12)
+_TITLE_FONT.setBold(True)
+
+# Header and string cell fonts, shared the same way
+_HEADER_FONT = QFont()
+_HEADER_FONT.setPointSize(12)
+_HEADER_FONT.setBold(True)
+
+_ITEM_FONT = QFont()
+_ITEM_FONT.setPointSize(11)
+_ITEM_FONT.setWeight(QFont.Medium)
+
+# Accent color of the GUI and Custom columns, used for the header text and radio indicators
+_CHOICE_COLORS = (QColor("#007bff"), QColor("#28a745"))
+_ITEM_COLOR = QColor("#343a40")
+_ITEM_BACKGROUND = QColor("#f8f9fa")
+
+_ROW_HEIGHT = 40  # Fixed height of each table row in pixels
+_CHOICE_COLUMN_WIDTH = 110  # Width of the GUI and Custom columns in pixels
+_INDICATOR_SIZE = 18  # Diameter of a radio indicator in pixels
+_CELL_GAP = 8  # Space between string cells and around their right edge
+_CELL_PADDING = 8  # Inner padding of a string cell
+_CELL_RADIUS = 4  # Corner radius of a string cell
+
+# Window styling, applied once on the top-level widget. The table view's header
+# is a QFrame too, so its rule comes after the QFrame rule to override it.
+_WINDOW_QSS = """
+    QWidget {
+        background-color: #f8f9fa;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    QFrame {
+        background-color: white;
+        border: 1px solid #dee2e6;
+        border-radius: 8px;
+        padding: 15px;
+    }
+    QLabel {
+        color: #495057;
+    }
+    QPushButton {
+        background-color: #007bff;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 20px;
+        font-weight: bold;
+        font-size: 11pt;
+    }
+    QPushButton:hover {
+        background-color: #0056b3;
+    }
+    QPushButton:pressed {
+        background-color: #004085;
+    }
+    QLabel#titleLabel {
+        color: #212529;
+        margin-bottom: 10px;
+    }
+    QHeaderView {
+        background-color: white;
+        border: none;
+        padding: 0px;
+    }
+    QHeaderView::section {
+        background-color: white;
+        border: none;
+        padding: 8px;
+    }
+    QHeaderView::section:middle {
+        border-bottom: 2px solid #007bff;
+    }
+    QHeaderView::section:last {
+        border-bottom: 2px solid #28a745;
+    }
+"""
+
+
+class StyledChoiceTableModel(ChoiceTableModel):
+    """ChoiceTableModel with this window's fonts and colors for the cells and header"""
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and index.column() == 0:
+            if role == Qt.FontRole:
+                return _ITEM_FONT
+            if role == Qt.ForegroundRole:
+                return _ITEM_COLOR
+            if role == Qt.BackgroundRole:
+                return _ITEM_BACKGROUND
+        return super().data(index, role)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal or section == 0:
+            return None
+        if role == Qt.DisplayRole:
+            return _CHOICES[section - 1]
+        if role == Qt.FontRole:
+            return _HEADER_FONT
+        if role == Qt.ForegroundRole:
+            return _CHOICE_COLORS[section - 1]
+        return None
+
+
+class ColoredRadioDelegate(RadioDelegate):
+    """RadioDelegate drawing indicators in each column's accent color"""
+    # Pre-rendered indicators keyed by (choice, checked, device pixel ratio),
+    # so painting a cell is a single drawPixmap
+    _indicator_cache = {}
+
+    @classmethod
+    def indicator_pixmap(cls, choice: int, checked: bool, ratio: float) -> QPixmap:
+        """Return the cached indicator for a choice column, rendering it on first use"""
+        key = (choice, checked, ratio)
+        pixmap = cls._indicator_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(round(_INDICATOR_SIZE * ratio), round(_INDICATOR_SIZE * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+
+            color = _CHOICE_COLORS[choice]
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QPen(color, 2))
+            painter.setBrush(color if checked else QColor("white"))
+            painter.drawEllipse(QRectF(1, 1, _INDICATOR_SIZE - 2, _INDICATOR_SIZE - 2))
+            painter.end()
+
+            cls._indicator_cache[key] = pixmap
+        return pixmap
+
+    def paint(self, painter, option, index):
+        if index.column() == 0:
+            self.paint_string_cell(painter, option, index)
+            return
+
+        ratio = painter.device().devicePixelRatioF()
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        pixmap = self.indicator_pixmap(index.column() - 1, checked, ratio)
+        target = QStyle.alignedRect(option.direction, Qt.AlignCenter,
+                                    QSize(_INDICATOR_SIZE, _INDICATOR_SIZE), option.rect)
+        painter.drawPixmap(target.topLeft(), pixmap)
+
+    def paint_string_cell(self, painter, option, index):
+        """Paint the string on a rounded, padded background, leaving a gap between rows"""
+        cell = QRectF(option.rect).adjusted(0, _CELL_GAP / 2, -_CELL_GAP, -_CELL_GAP / 2)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(index.data(Qt.BackgroundRole))
+        painter.drawRoundedRect(cell, _CELL_RADIUS, _CELL_RADIUS)
+        painter.setFont(index.data(Qt.FontRole))
+        painter.setPen(index.data(Qt.ForegroundRole))
+        painter.drawText(cell.adjusted(_CELL_PADDING, 0, -_CELL_PADDING, 0),
+                         Qt.AlignLeft | Qt.AlignVCenter, index.data(Qt.DisplayRole))
+        painter.restore()
 
 
 class EnhancedTableDynamicWidget(QWidget):
@@ -17,7 +179,8 @@ class EnhancedTableDynamicWidget(QWidget):
     def __init__(self, string_list: List[str], parent=None):
         super().__init__(parent)
         self.string_list = string_list
-        self.button_groups = []
+        self.model = None  # Selection state for each string, created with the table
+        self.table_view = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -25,37 +188,8 @@ class EnhancedTableDynamicWidget(QWidget):
         self.setWindowTitle("Dynamic String Widget")
         self.setMinimumSize(500, 350)
 
-        # Apply styling
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f8f9fa;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QFrame {
-                background-color: white;
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                padding: 15px;
-            }
-            QLabel {
-                color: #495057;
-            }
-            QPushButton {
-                background-color: #007bff;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-weight: bold;
-                font-size: 11pt;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton:pressed {
-                background-color: #004085;
-            }
-        """)
+        # One stylesheet for the whole window
+        self.setStyleSheet(_WINDOW_QSS)
 
         # Main layout
         main_layout = QVBoxLayout()
@@ -64,30 +198,12 @@ class EnhancedTableDynamicWidget(QWidget):
 
         # Title
         title_label = QLabel("Select configuration for each item:")
-        title_font = QFont()
-        title_font.setPointSize(12)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setStyleSheet("color: #212529; margin-bottom: 10px;")
+        title_label.setFont(_TITLE_FONT)
+        title_label.setObjectName("titleLabel")
         main_layout.addWidget(title_label)
 
-        # Create scroll area
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameStyle(QFrame.NoFrame)
-        scroll_area.setStyleSheet("QScrollArea { background-color: transparent; }")
-
-        # Content widget
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-
-        # Create the table
-        table_frame = self.create_enhanced_table()
-        content_layout.addWidget(table_frame)
-        content_layout.addStretch()
-
-        scroll_area.setWidget(content_widget)
-        main_layout.addWidget(scroll_area)
+        # Create the table (the table view scrolls by itself and is styled as the card)
+        main_layout.addWidget(self.create_enhanced_table())
 
         # Button layout
         button_layout = QHBoxLayout()
@@ -101,139 +217,54 @@ class EnhancedTableDynamicWidget(QWidget):
         main_layout.addLayout(button_layout)
         self.setLayout(main_layout)
 
-    def create_enhanced_table(self) -> QFrame:
+    def create_enhanced_table(self) -> QTableView:
         """Create an enhanced table layout"""
-        frame = QFrame()
-
-        # Grid layout
-        grid_layout = QGridLayout(frame)
-        grid_layout.setSpacing(15)
-        grid_layout.setContentsMargins(20, 20, 20, 20)
-
-        # Set column stretch to make columns evenly distributed
-        grid_layout.setColumnStretch(0, 2)  # String column wider
-        grid_layout.setColumnStretch(1, 1)  # GUI column
-        grid_layout.setColumnStretch(2, 1)  # Custom column
-
-        # Headers with styling
-        empty_header = QLabel("")
-        grid_layout.addWidget(empty_header, 0, 0)
-
-        gui_header = QLabel("GUI")
-        gui_header.setAlignment(Qt.AlignCenter)
-        gui_header.setStyleSheet("""
-            QLabel {
-                font-size: 12pt;
-                font-weight: bold;
-                color: #007bff;
-                padding: 8px;
-                border-bottom: 2px solid #007bff;
-            }
-        """)
-        grid_layout.addWidget(gui_header, 0, 1)
-
-        custom_header = QLabel("Custom")
-        custom_header.setAlignment(Qt.AlignCenter)
-        custom_header.setStyleSheet("""
-            QLabel {
-                font-size: 12pt;
-                font-weight: bold;
-                color: #28a745;
-                padding: 8px;
-                border-bottom: 2px solid #28a745;
-            }
-        """)
-        grid_layout.addWidget(custom_header, 0, 2)
-
-        # Add rows for each string
-        for i, string_item in enumerate(self.string_list):
-            row = i + 1
-
-            # String label with styling
-            string_label = QLabel(string_item)
-            string_label.setStyleSheet("""
-                QLabel {
-                    font-size: 11pt;
-                    font-weight: 500;
-                    color: #343a40;
-                    padding: 8px;
-                    background-color: #f8f9fa;
-                    border-radius: 4px;
-                }
-            """)
-            grid_layout.addWidget(string_label, row, 0)
-
-            # Button group
-            button_group = QButtonGroup(self)
-
-            # GUI radio button
-            gui_radio = QRadioButton()
-            gui_radio.setStyleSheet("""
-                QRadioButton::indicator {
-                    width: 18px;
-                    height: 18px;
-                    border-radius: 9px;
-                    border: 2px solid #007bff;
-                    background-color: white;
-                }
-                QRadioButton::indicator:checked {
-                    background-color: #007bff;
-                    border: 2px solid #007bff;
-                }
-                QRadioButton::indicator:hover {
-                    border: 2px solid #0056b3;
-                }
-            """)
-            button_group.addButton(gui_radio, 0)
-
-            # Create container for centering
-            gui_container = QWidget()
-            gui_layout = QHBoxLayout(gui_container)
-            gui_layout.addStretch()
-            gui_layout.addWidget(gui_radio)
-            gui_layout.addStretch()
-            gui_layout.setContentsMargins(0, 0, 0, 0)
-            grid_layout.addWidget(gui_container, row, 1)
-
-            # Custom radio button
-            custom_radio = QRadioButton()
-            custom_radio.setStyleSheet("""
-                QRadioButton::indicator {
-                    width: 18px;
-                    height: 18px;
-                    border-radius: 9px;
-                    border: 2px solid #28a745;
-                    background-color: white;
-                }
-                QRadioButton::indicator:checked {
-                    background-color: #28a745;
-                    border: 2px solid #28a745;
-                }
-                QRadioButton::indicator:hover {
-                    border: 2px solid #1e7e34;
-                }
-            """)
-            button_group.addButton(custom_radio, 1)
-
-            # Create container for centering
-            custom_container = QWidget()
-            custom_layout = QHBoxLayout(custom_container)
-            custom_layout.addStretch()
-            custom_layout.addWidget(custom_radio)
-            custom_layout.addStretch()
-            custom_layout.setContentsMargins(0, 0, 0, 0)
-            grid_layout.addWidget(custom_container, row, 2)
-
-            self.button_groups.append((string_item, button_group))
-
-        return frame
+        # Rows live in a model; the view only paints the rows that are visible
+        self.model = StyledChoiceTableModel(self.string_list, self)
+
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+        self.table_view.setItemDelegate(ColoredRadioDelegate(self.table_view))
+
+        # String column takes the spare width, choice columns stay fixed
+        header = self.table_view.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.Fixed)
+        header.setSectionResizeMode(2, QHeaderView.Fixed)
+        header.resizeSection(1, _CHOICE_COLUMN_WIDTH)
+        header.resizeSection(2, _CHOICE_COLUMN_WIDTH)
+        header.setDefaultAlignment(Qt.AlignCenter)
+        header.setSectionsClickable(False)
+        header.setHighlightSections(False)
+
+        # Fixed row height lets the view compute row positions without measuring
+        self.table_view.verticalHeader().hide()
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(_ROW_HEIGHT)
+
+        self.table_view.setShowGrid(False)
+        self.table_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_view.setFocusPolicy(Qt.NoFocus)
+        self.table_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        return self.table_view
+
+    def update_list(self, string_list: List[str]):
+        """Show a new list of strings in this widget, keeping the existing view"""
+        self.string_list = string_list
+        self.model.set_strings(string_list)
 
     def on_ok_clicked(self):
         """Handle OK button click with validation"""
+        # Single pass: collect unselected items and the result together
         unselected_items = []
-        for string_item, button_group in self.button_groups:
-            if button_group.checkedId() == -1:
+        result = []
+        for string_item, choice in zip(self.model.strings, self.model.choices):
+            if choice == -1:
                 unselected_items.append(string_item)
+            else:
+                result.append((string_item, _CHOICES[choice]))
 
         if unselected_items:
             items_text = ", ".join(unselected_items)
@@ -245,18 +276,14 @@ class EnhancedTableDynamicWidget(QWidget):
             )
             return
 
-        result = self.get_result()
         self.result_ready.emit(result)
         self.close()
 
     def get_result(self) -> List[Tuple[str, str]]:
         """Get the current selection as a list of tuples"""
-        result = []
-        for string_item, button_group in self.button_groups:
-            checked_id = button_group.checkedId()
-            choice = "GUI" if checked_id == 0 else "Custom"
-            result.append((string_item, choice))
-        return result
+        # A choice of -1 (nothing selected) indexes "Custom"
+        return [(string_item, _CHOICES[choice])
+                for string_item, choice in zip(self.model.strings, self.model.choices)]
 
 
 def main():
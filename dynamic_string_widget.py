@@ -1,12 +1,127 @@
 
 import sys
+from array import array
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-                               QLabel, QPushButton, QButtonGroup, QRadioButton,
-                               QScrollArea, QFrame)
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
+                               QPushButton, QFrame, QListView, QAbstractItemView,
+                               QStyledItemDelegate, QStyleOptionButton, QStyle)
+from PySide6.QtCore import (Qt, Signal, QAbstractListModel, QModelIndex, QEvent,
+                            QRect, QSize)
+from PySide6.QtGui import QPalette
 from typing import List, Tuple
 
+# Result label for each choice id (0 = GUI, 1 = Custom)
+_CHOICES = ("GUI", "Custom")
+
+# Item data role carrying a row's choice id (-1 = none)
+CHOICE_ROLE = Qt.UserRole
+
+_ROW_HEIGHT = 40  # Fixed height of each item in pixels
+_ITEM_PADDING = 10  # Space between an item's border and its contents
+_CHOICE_SPACING = 20  # Space before each radio button
+_LABEL_SPACING = 6  # Space between a radio indicator and its text
+
+
+class StringChoiceModel(QAbstractListModel):
+    """
+    List model holding one GUI/Custom choice per string.
+    """
+
+    def __init__(self, string_list: List[str], parent=None):
+        super().__init__(parent)
+        self.strings = list(string_list)
+        # Index into _CHOICES per string, -1 while unchosen
+        self.choices = array('b', [-1]) * len(self.strings)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.strings)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return f"{row + 1}. {self.strings[row]}"
+        if role == CHOICE_ROLE:
+            return self.choices[row]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        """Select a choice (0 = GUI, 1 = Custom) for the row"""
+        if role != CHOICE_ROLE or not index.isValid() or value not in (0, 1):
+            return False
+        row = index.row()
+        if self.choices[row] != value:
+            self.choices[row] = value
+            self.dataChanged.emit(index, index, [CHOICE_ROLE])
+        return True
+
+
+class RadioChoiceDelegate(QStyledItemDelegate):
+    """
+    Paints each item as its label followed by GUI and Custom radio buttons,
+    and turns clicks on a radio button or its text into a choice,
+    so no per-item widgets are needed.
+    """
+
+    def choice_rects(self, option, index) -> List[QRect]:
+        """Return the clickable rect (indicator and text) of each choice in an item"""
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        metrics = option.fontMetrics
+        indicator_width = style.pixelMetric(QStyle.PM_ExclusiveIndicatorWidth)
+
+        rects = []
+        x = (option.rect.left() + _ITEM_PADDING
+             + metrics.horizontalAdvance(index.data()) + _CHOICE_SPACING)
+        for label in _CHOICES:
+            width = indicator_width + _LABEL_SPACING + metrics.horizontalAdvance(label)
+            rects.append(QRect(x, option.rect.top(), width, option.rect.height()))
+            x += width + _CHOICE_SPACING
+        return rects
+
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        indicator_size = QSize(style.pixelMetric(QStyle.PM_ExclusiveIndicatorWidth),
+                               style.pixelMetric(QStyle.PM_ExclusiveIndicatorHeight))
+        text_color = option.palette.color(QPalette.Text)
+
+        painter.save()
+
+        # Item border, in place of the per-item StyledPanel frame
+        painter.setPen(option.palette.color(QPalette.Mid))
+        painter.drawRect(option.rect.adjusted(0, 0, -1, -1))
+
+        painter.setPen(text_color)
+        painter.drawText(option.rect.adjusted(_ITEM_PADDING, 0, 0, 0),
+                         Qt.AlignLeft | Qt.AlignVCenter, index.data())
+
+        choice = index.data(CHOICE_ROLE)
+        for choice_id, (label, rect) in enumerate(zip(_CHOICES, self.choice_rects(option, index))):
+            radio_option = QStyleOptionButton()
+            radio_option.rect = QStyle.alignedRect(option.direction, Qt.AlignLeft | Qt.AlignVCenter,
+                                                   indicator_size, rect)
+            radio_option.state = QStyle.State_Enabled
+            radio_option.state |= QStyle.State_On if choice == choice_id else QStyle.State_Off
+            style.drawPrimitive(QStyle.PE_IndicatorRadioButton, radio_option, painter, widget)
+
+            painter.drawText(rect.adjusted(indicator_size.width() + _LABEL_SPACING, 0, 0, 0),
+                             Qt.AlignLeft | Qt.AlignVCenter, label)
+
+        painter.restore()
+
+    def sizeHint(self, option, index) -> QSize:
+        last_rect = self.choice_rects(option, index)[-1]
+        return QSize(last_rect.right() + _ITEM_PADDING - option.rect.left(), _ROW_HEIGHT)
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            position = event.position().toPoint()
+            for choice_id, rect in enumerate(self.choice_rects(option, index)):
+                if rect.contains(position):
+                    return model.setData(index, choice_id, CHOICE_ROLE)
+        return False
+
 
 class DynamicStringWidget(QWidget):
     """
@@ -19,7 +134,8 @@ class DynamicStringWidget(QWidget):
     def __init__(self, string_list: List[str], parent=None):
         super().__init__(parent)
         self.string_list = string_list
-        self.button_groups = []  # Store button groups for each string
+        self.model = None  # Selection state for each string, created with the view
+        self.view = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -30,25 +146,22 @@ class DynamicStringWidget(QWidget):
         # Main layout
         main_layout = QVBoxLayout()
 
-        # Create scroll area for the string items
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameStyle(QFrame.NoFrame)
+        # Items live in a model; the list view only paints the visible ones
+        self.model = StringChoiceModel(self.string_list, self)
 
-        # Content widget for scroll area
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setItemDelegate(RadioChoiceDelegate(self.view))
+        self.view.setUniformItemSizes(True)  # Every item has the same height
+        self.view.setSpacing(3)
+        self.view.setFrameStyle(QFrame.NoFrame)
+        self.view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.view.setFocusPolicy(Qt.NoFocus)
+        # Match the window background, like the scroll area it replaces
+        self.view.viewport().setAutoFillBackground(False)
 
-        # Create items for each string
-        for i, string_item in enumerate(self.string_list, 1):
-            item_frame = self.create_string_item(i, string_item)
-            content_layout.addWidget(item_frame)
-
-        content_layout.addStretch()  # Add stretch to push items to top
-        scroll_area.setWidget(content_widget)
-
-        # Add scroll area to main layout
-        main_layout.addWidget(scroll_area)
+        main_layout.addWidget(self.view)
 
         # Create OK button layout (right-aligned)
         button_layout = QHBoxLayout()
@@ -62,49 +175,6 @@ class DynamicStringWidget(QWidget):
         main_layout.addLayout(button_layout)
         self.setLayout(main_layout)
 
-    def create_string_item(self, index: int, string_item: str) -> QFrame:
-        """Create a frame containing the string label and radio buttons"""
-        frame = QFrame()
-        frame.setFrameStyle(QFrame.StyledPanel)
-        # frame.setStyleSheet("QFrame { margin: 5px; padding: 10px; }")
-
-        layout = QVBoxLayout(frame)
-
-        # String label with index
-        label = QLabel(f"{index}. {string_item}")
-        # font = QFont()
-        # font.setPointSize(10)
-        # font.setBold(True)
-        # label.setFont(font)
-        layout.addWidget(label)
-
-        # Radio buttons layout
-        radio_layout = QHBoxLayout()
-        radio_layout.setContentsMargins(20, 5, 0, 5)  # Indent the radio buttons
-
-        # Create button group for this string item
-        button_group = QButtonGroup(self)
-
-        # GUI radio button
-        gui_radio = QRadioButton("GUI")
-        # gui_radio.setChecked(True)  # Default selection
-        button_group.addButton(gui_radio, 0)
-        radio_layout.addWidget(gui_radio)
-
-        # Custom radio button
-        custom_radio = QRadioButton("Custom")
-        button_group.addButton(custom_radio, 1)
-        radio_layout.addWidget(custom_radio)
-
-        radio_layout.addStretch()  # Push radio buttons to the left
-
-        layout.addLayout(radio_layout)
-
-        # Store the button group with the associated string
-        self.button_groups.append((string_item, button_group))
-
-        return frame
-
     def on_ok_clicked(self):
         """Handle OK button click and emit result"""
         result = self.get_result()
@@ -113,13 +183,9 @@ class DynamicStringWidget(QWidget):
 
     def get_result(self) -> List[Tuple[str, str]]:
         """Get the current selection as a list of tuples"""
-        result = []
-        for string_item, button_group in self.button_groups:
-            # Get the checked button ID (0 for GUI, 1 for Custom)
-            checked_id = button_group.checkedId()
-            choice = "GUI" if checked_id == 0 else "Custom"
-            result.append((string_item, choice))
-        return result
+        # Anything but GUI (including no selection, -1) counts as Custom
+        return [(string_item, _CHOICES[choice])
+                for string_item, choice in zip(self.model.strings, self.model.choices)]
 
 
 def main():
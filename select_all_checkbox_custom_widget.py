@@ -8,6 +8,9 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont
 from typing import List, Tuple
 
+# Row label styling, applied once on the table frame and matched by object name
+_ROW_QSS = "QLabel#str_label { font-size: 10pt; }"
+
 
 class DynamicStringWidget(QWidget):
     """
@@ -68,6 +71,7 @@ class DynamicStringWidget(QWidget):
         """Create a table-like layout with headers and radio buttons"""
         frame = QFrame()
         frame.setFrameStyle(QFrame.StyledPanel)
+        frame.setStyleSheet(_ROW_QSS)
 
         # Use QGridLayout for table-like appearance
         grid_layout = QGridLayout(frame)
@@ -101,7 +105,7 @@ class DynamicStringWidget(QWidget):
 
         self.gui_checkbox = QCheckBox()
         self.gui_checkbox.setTristate(True)  # Allow partial state
-        self.gui_checkbox.stateChanged.connect(self.on_gui_checkbox_changed)
+        self.gui_checkbox.checkStateChanged.connect(self.on_gui_checkbox_changed)
         gui_checkbox_layout.addWidget(self.gui_checkbox)
         gui_checkbox_layout.addStretch()
 
@@ -128,7 +132,7 @@ class DynamicStringWidget(QWidget):
 
         self.custom_checkbox = QCheckBox()
         self.custom_checkbox.setTristate(True)  # Allow partial state
-        self.custom_checkbox.stateChanged.connect(self.on_custom_checkbox_changed)
+        self.custom_checkbox.checkStateChanged.connect(self.on_custom_checkbox_changed)
         custom_checkbox_layout.addWidget(self.custom_checkbox)
         custom_checkbox_layout.addStretch()
 
@@ -141,7 +145,7 @@ class DynamicStringWidget(QWidget):
 
             # String label
             string_label = QLabel(string_item)
-            string_label.setStyleSheet("QLabel { font-size: 10pt; }")
+            string_label.setObjectName("str_label")
             grid_layout.addWidget(string_label, row, 0)
 
             # Create button group for this string item
@@ -150,30 +154,15 @@ class DynamicStringWidget(QWidget):
             # GUI radio button (centered)
             gui_radio = QRadioButton()
             button_group.addButton(gui_radio, 0)
-            gui_radio.toggled.connect(self.update_checkbox_states)
-
-            # Center the radio button
-            gui_radio_container = QWidget()
-            gui_radio_layout = QHBoxLayout(gui_radio_container)
-            gui_radio_layout.setContentsMargins(0, 0, 0, 0)
-            gui_radio_layout.addStretch()
-            gui_radio_layout.addWidget(gui_radio)
-            gui_radio_layout.addStretch()
-            grid_layout.addWidget(gui_radio_container, row, 1)
+            grid_layout.addWidget(gui_radio, row, 1, Qt.AlignCenter)
 
             # Custom radio button (centered)
             custom_radio = QRadioButton()
             button_group.addButton(custom_radio, 1)
-            custom_radio.toggled.connect(self.update_checkbox_states)
+            grid_layout.addWidget(custom_radio, row, 2, Qt.AlignCenter)
 
-            # Center the radio button
-            custom_radio_container = QWidget()
-            custom_radio_layout = QHBoxLayout(custom_radio_container)
-            custom_radio_layout.setContentsMargins(0, 0, 0, 0)
-            custom_radio_layout.addStretch()
-            custom_radio_layout.addWidget(custom_radio)
-            custom_radio_layout.addStretch()
-            grid_layout.addWidget(custom_radio_container, row, 2)
+            # One connection per row; the group signals whichever radio toggled
+            button_group.idToggled.connect(self.update_checkbox_states)
 
             # Store the button group with the associated string
             self.button_groups.append((string_item, button_group))
@@ -210,43 +199,63 @@ class DynamicStringWidget(QWidget):
         self.gui_checkbox.blockSignals(False)
         self.custom_checkbox.blockSignals(False)
 
+    def _bulk_set(self, button_id: int):
+        """Check the same radio button in every row with a single checkbox update"""
+        # Group signals are blocked so update_checkbox_states runs once, not once per row
+        self.setUpdatesEnabled(False)
+        try:
+            for _, button_group in self.button_groups:
+                button_group.blockSignals(True)
+                button_group.button(button_id).setChecked(True)
+                button_group.blockSignals(False)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update_checkbox_states()
+
+    def _bulk_clear(self, button_id: int):
+        """Uncheck the given radio button in every row where it is checked"""
+        self.setUpdatesEnabled(False)
+        try:
+            for _, button_group in self.button_groups:
+                if button_group.checkedId() == button_id:
+                    # An exclusive group refuses to uncheck its checked button,
+                    # so lift exclusivity on the group itself for the write
+                    button_group.blockSignals(True)
+                    button_group.setExclusive(False)
+                    button_group.button(button_id).setChecked(False)
+                    button_group.setExclusive(True)
+                    button_group.blockSignals(False)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update_checkbox_states()
+
     def on_gui_checkbox_changed(self, state):
         """Handle GUI checkbox state change"""
-        if state == Qt.Checked:
+        # A click on an unchecked tristate box lands on PartiallyChecked; partial
+        # states set by update_checkbox_states are emitted with signals blocked
+        if state in (Qt.Checked, Qt.PartiallyChecked):
             # Select all GUI
-            for _, button_group in self.button_groups:
-                button_group.button(0).setChecked(True)
+            self._bulk_set(0)
             # Clear custom checkbox
             self.custom_checkbox.blockSignals(True)
             self.custom_checkbox.setCheckState(Qt.Unchecked)
             self.custom_checkbox.blockSignals(False)
         elif state == Qt.Unchecked:
             # Clear all GUI selections only if they were selected
-            for _, button_group in self.button_groups:
-                if button_group.checkedId() == 0:
-                    gui_radio = button_group.button(0)
-                    gui_radio.setAutoExclusive(False)
-                    gui_radio.setChecked(False)
-                    gui_radio.setAutoExclusive(True)
+            self._bulk_clear(0)
 
     def on_custom_checkbox_changed(self, state):
         """Handle Custom checkbox state change"""
-        if state == Qt.Checked:
+        if state in (Qt.Checked, Qt.PartiallyChecked):
             # Select all Custom
-            for _, button_group in self.button_groups:
-                button_group.button(1).setChecked(True)
+            self._bulk_set(1)
             # Clear gui checkbox
             self.gui_checkbox.blockSignals(True)
             self.gui_checkbox.setCheckState(Qt.Unchecked)
             self.gui_checkbox.blockSignals(False)
         elif state == Qt.Unchecked:
             # Clear all Custom selections only if they were selected
-            for _, button_group in self.button_groups:
-                if button_group.checkedId() == 1:
-                    custom_radio = button_group.button(1)
-                    custom_radio.setAutoExclusive(False)
-                    custom_radio.setChecked(False)
-                    custom_radio.setAutoExclusive(True)
+            self._bulk_clear(1)
 
     def on_ok_clicked(self):
         """Handle OK button click with validation"""
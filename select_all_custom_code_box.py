@@ -1,11 +1,22 @@
 
 import sys
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-                               QLabel, QPushButton, QButtonGroup, QRadioButton,
-                               QScrollArea, QFrame, QMessageBox, QGridLayout)
-from PySide6.QtCore import Qt, Signal
+                               QLabel, QPushButton, QFrame, QMessageBox, QGridLayout,
+                               QTableView, QHeaderView, QAbstractItemView)
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QFont
 from typing import List, Tuple
+from choice_table import ChoiceTableModel, RadioDelegate, show_all_rows
+
+# Result label for each choice id (0 = GUI, 1 = Custom)
+_CHOICE_STR = ("GUI", "Custom")
+
+# Bold font for the header buttons, built once and shared
+_HEADER_FONT = QFont()
+_HEADER_FONT.setBold(True)
+
+_ROW_HEIGHT = 30  # Fixed height of each table row in pixels
+_MAX_UNSCROLLED_ROWS = 8  # Lists up to this length are shown in full, without scrolling
 
 
 class DynamicStringWidget(QWidget):
@@ -20,7 +31,11 @@ class DynamicStringWidget(QWidget):
     def __init__(self, string_list: List[str], parent=None):
         super().__init__(parent)
         self.string_list = string_list
-        self.button_groups = []  # Store button groups for each string
+        self.model = None  # Selection state for each string, created with the table
+        self.table_view = None
+        self._gui_count = 0  # Rows currently set to GUI
+        self._custom_count = 0  # Rows currently set to Custom
+        self._total = len(string_list)  # Row count never changes after construction
         self.setup_ui()
 
     def setup_ui(self):
@@ -31,24 +46,11 @@ class DynamicStringWidget(QWidget):
         # Main layout
         main_layout = QVBoxLayout()
 
-        # Create scroll area for the string items
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameStyle(QFrame.NoFrame)
-
-        # Content widget for scroll area
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-
-        # Create the table-like layout
+        # Create the table-like layout (the table view scrolls by itself)
         table_frame = self.create_table_layout()
-        content_layout.addWidget(table_frame)
-
-        content_layout.addStretch()  # Add stretch to push items to top
-        scroll_area.setWidget(content_widget)
-
-        # Add scroll area to main layout
-        main_layout.addWidget(scroll_area)
+        main_layout.addWidget(table_frame)
+        if self._total <= _MAX_UNSCROLLED_ROWS:
+            main_layout.addStretch()  # Short tables have a fixed height; keep them at the top
 
         # Create OK button layout (right-aligned)
         button_layout = QHBoxLayout()
@@ -78,93 +80,95 @@ class DynamicStringWidget(QWidget):
         # GUI header button
         gui_button = QPushButton("GUI")
         gui_button.clicked.connect(self.select_all_gui)
-        font = QFont()
-        font.setBold(True)
-        gui_button.setFont(font)
+        gui_button.setFont(_HEADER_FONT)
         grid_layout.addWidget(gui_button, 0, 1)
 
         # Custom header button
         custom_button = QPushButton("Custom")
         custom_button.clicked.connect(self.select_all_custom)
-        custom_button.setFont(font)
+        custom_button.setFont(_HEADER_FONT)
         grid_layout.addWidget(custom_button, 0, 2)
 
-        # Add rows for each string
-        for i, string_item in enumerate(self.string_list, 1):
-            row = i  # Start from row 1 (row 0 is headers)
-
-            # String label
-            string_label = QLabel(string_item)
-            grid_layout.addWidget(string_label, row, 0)
-
-            # Create button group for this string item
-            button_group = QButtonGroup(self)
-
-            # GUI radio button (centered)
-            gui_radio = QRadioButton()
-            gui_radio.setStyleSheet("QRadioButton { margin-left: 50%; margin-right: 50%; }")
-            button_group.addButton(gui_radio, 0)
-            grid_layout.addWidget(gui_radio, row, 1, Qt.AlignCenter)
-
-            # Custom radio button (centered)
-            custom_radio = QRadioButton()
-            custom_radio.setStyleSheet("QRadioButton { margin-left: 50%; margin-right: 50%; }")
-            button_group.addButton(custom_radio, 1)
-            grid_layout.addWidget(custom_radio, row, 2, Qt.AlignCenter)
-
-            # Store the button group with the associated string
-            self.button_groups.append((string_item, button_group))
+        # Rows live in a model; the view only paints the rows that are visible
+        self.model = ChoiceTableModel(self.string_list, self)
+        self.model.choice_toggled.connect(self.on_choice_toggled)
+
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+        self.table_view.setItemDelegate(RadioDelegate(self.table_view))
+        self.table_view.horizontalHeader().hide()
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table_view.verticalHeader().hide()
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(_ROW_HEIGHT)
+        self.table_view.setShowGrid(False)
+        self.table_view.setFrameStyle(QFrame.NoFrame)
+        self.table_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_view.setFocusPolicy(Qt.NoFocus)
+
+        if self._total <= _MAX_UNSCROLLED_ROWS:
+            show_all_rows(self.table_view, self._total, _ROW_HEIGHT)
+
+        # Equal column stretch keeps the header buttons over the view's columns
+        for column in range(3):
+            grid_layout.setColumnStretch(column, 1)
+        grid_layout.addWidget(self.table_view, 1, 0, 1, 3)
 
         return frame
 
+    @Slot(int, bool)
+    def on_choice_toggled(self, button_id: int, checked: bool):
+        """Keep the per-column selection counts in step with single-row changes"""
+        delta = 1 if checked else -1
+        if button_id == 0:
+            self._gui_count += delta
+        else:
+            self._custom_count += delta
+
     def are_all_gui_selected(self) -> bool:
         """Check if all GUI radio buttons are selected"""
-        return all(bg.checkedId() == 0 for _, bg in self.button_groups)
+        return self._gui_count == self._total
 
     def are_all_custom_selected(self) -> bool:
         """Check if all Custom radio buttons are selected"""
-        return all(bg.checkedId() == 1 for _, bg in self.button_groups)
+        return self._custom_count == self._total
 
+    @Slot()
     def select_all_gui(self):
         """Select all GUI radio buttons, or deselect all if all GUI are already selected"""
         if self.are_all_gui_selected():
             # All GUI are selected, so deselect all (clear all selections)
             self.clear_all_selections()
         else:
-            # Select all GUI buttons (this will automatically deselect any Custom buttons due to radio button behavior)
-            for _, button_group in self.button_groups:
-                button_group.button(0).setChecked(True)
+            # Select all GUI buttons (this replaces any Custom selections)
+            self.model.set_all_choices(0)
+            self._gui_count = self._total
+            self._custom_count = 0
 
+    @Slot()
     def select_all_custom(self):
         """Select all Custom radio buttons, or deselect all if all Custom are already selected"""
         if self.are_all_custom_selected():
             # All Custom are selected, so deselect all (clear all selections)
             self.clear_all_selections()
         else:
-            # Select all Custom buttons (this will automatically deselect any GUI buttons due to radio button behavior)
-            for _, button_group in self.button_groups:
-                button_group.button(1).setChecked(True)
+            # Select all Custom buttons (this replaces any GUI selections)
+            self.model.set_all_choices(1)
+            self._gui_count = 0
+            self._custom_count = self._total
 
     def clear_all_selections(self):
         """Clear all radio button selections"""
-        for _, button_group in self.button_groups:
-            # Get the currently checked button and uncheck it
-            checked_button = button_group.checkedButton()
-            if checked_button:
-                checked_button.setAutoExclusive(False)  # Temporarily disable auto-exclusive
-                checked_button.setChecked(False)        # Uncheck
-                checked_button.setAutoExclusive(True)   # Re-enable auto-exclusive
+        self.model.clear_choices()
+        self._gui_count = 0
+        self._custom_count = 0
 
+    @Slot()
     def on_ok_clicked(self):
         """Handle OK button click with validation"""
-        # Check if all selections are made
-        unselected_items = []
-        for string_item, button_group in self.button_groups:
-            if button_group.checkedId() == -1:  # -1 means no selection
-                unselected_items.append(string_item)
-
-        # If there are unselected items, show warning and return
-        if unselected_items:
+        # If any selection is missing (-1), show warning and return
+        if -1 in self.model.choices:
             QMessageBox.warning(
                 self, 
                 "Incomplete Selection", 
@@ -180,13 +184,9 @@ class DynamicStringWidget(QWidget):
 
     def get_result(self) -> List[Tuple[str, str]]:
         """Get the current selection as a list of tuples"""
-        result = []
-        for string_item, button_group in self.button_groups:
-            # Get the checked button ID (0 for GUI, 1 for Custom)
-            checked_id = button_group.checkedId()
-            choice = "GUI" if checked_id == 0 else "Custom"
-            result.append((string_item, choice))
-        return result
+        # Choice 0 is GUI; 1 and no selection (-1) both index "Custom"
+        return [(string_item, _CHOICE_STR[choice])
+                for string_item, choice in zip(self.model.strings, self.model.choices)]
 
 
 def main():
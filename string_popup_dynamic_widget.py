@@ -1,12 +1,54 @@
 
 import sys
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-                               QLabel, QPushButton, QButtonGroup, QRadioButton,
-                               QScrollArea, QFrame, QMessageBox, QGridLayout, 
-                               QCheckBox, QTextEdit)
-from PySide6.QtCore import Qt, Signal
+                               QLabel, QPushButton, QFrame, QMessageBox, QGridLayout,
+                               QCheckBox, QTableView, QHeaderView, QAbstractItemView)
+from PySide6.QtCore import Qt, Signal, Slot, QObject
 from PySide6.QtGui import QFont
-from typing import List, Tuple, Optional
+from typing import Callable, List, Tuple, Optional
+from choice_table import ChoiceTableModel, RadioDelegate, show_all_rows
+
+# Result label for each choice id (0 = GUI, 1 = Custom)
+_CHOICE_STR = ("GUI", "Custom")
+
+# Bold 11pt font for the column headers, built once and shared
+_HEADER_FONT = QFont()
+_HEADER_FONT.setBold(True)
+_HEADER_FONT.setPointSize(11)
+
+_ROW_HEIGHT = 30  # Fixed height of each table row in pixels
+_MAX_UNSCROLLED_ROWS = 8  # Lists up to this length are shown in full, without scrolling
+_QWIDGETSIZE_MAX = (1 << 24) - 1  # Qt's maximum widget size, for lifting a fixed height
+
+# Box text lines longer than this are word-wrapped; shorter text is laid out
+# without wrapping so the window never has to solve height-for-width
+_WRAP_MIN_LINE_LENGTH = 60
+
+
+class StringListProvider(QObject):
+    """
+    Worker that builds the string list away from the GUI thread.
+    Move it to a QThread, connect the thread's started signal to run,
+    and pass it to DynamicStringWidget.from_async.
+    """
+    # Emitted with the finished string list
+    ready = Signal(list)
+    # Emitted with the error message instead of ready if load raises
+    failed = Signal(str)
+
+    def __init__(self, load: Callable[[], List[str]], parent=None):
+        super().__init__(parent)
+        self._load = load
+
+    @Slot()
+    def run(self):
+        """Build the list (on the worker's thread) and hand it over"""
+        try:
+            string_list = list(self._load())
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.ready.emit(string_list)
 
 
 class DynamicStringWidget(QWidget):
@@ -22,11 +64,23 @@ class DynamicStringWidget(QWidget):
         super().__init__(parent)
         self.string_list = string_list
         self.box_text = box_text
-        self.button_groups = []  # Store button groups for each string
+        self.model = None  # Selection state for each string, created with the table
+        self.table_view = None
         self.gui_checkbox = None
         self.custom_checkbox = None
+        self.table_frame = None
+        self.main_layout = None
         self.setup_ui()
 
+    @classmethod
+    def from_async(cls, provider: StringListProvider, box_text: Optional[str] = None,
+                   parent=None) -> "DynamicStringWidget":
+        """Create an empty widget that fills its table when the provider's list is ready"""
+        widget = cls([], box_text, parent)
+        provider.ready.connect(widget._on_list_ready)
+        provider.failed.connect(widget._on_list_failed)
+        return widget
+
     def setup_ui(self):
         """Set up the user interface"""
         self.setWindowTitle("Dynamic String Widget")
@@ -42,24 +96,12 @@ class DynamicStringWidget(QWidget):
             text_box = self.create_text_box()
             main_layout.addWidget(text_box)
 
-        # Create scroll area for the string items
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameStyle(QFrame.NoFrame)
-
-        # Content widget for scroll area
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-
-        # Create the table-like layout
-        table_frame = self.create_table_layout()
-        content_layout.addWidget(table_frame)
-
-        content_layout.addStretch()  # Add stretch to push items to top
-        scroll_area.setWidget(content_widget)
-
-        # Add scroll area to main layout
-        main_layout.addWidget(scroll_area)
+        # Create the table-like layout (the table view scrolls by itself)
+        self.table_frame = self.create_table_layout()
+        main_layout.addWidget(self.table_frame)
+        main_layout.addStretch()  # Keeps short, fixed-height tables at the top
+        self.main_layout = main_layout
+        self._fit_table_to_rows()
 
         # Create OK button layout (right-aligned)
         button_layout = QHBoxLayout()
@@ -76,7 +118,7 @@ class DynamicStringWidget(QWidget):
     def create_text_box(self) -> QFrame:
         """Create a text box frame to display the provided text"""
         frame = QFrame()
-        frame.setFrameStyle(QFrame.StyledPanel | QFrame.Raised)
+        frame.setFrameStyle(QFrame.NoFrame)  # The stylesheet below draws the border
         frame.setStyleSheet("""
             QFrame {
                 background-color: #f8f9fa;
@@ -92,7 +134,8 @@ class DynamicStringWidget(QWidget):
 
         # Create text display
         text_label = QLabel(self.box_text)
-        text_label.setWordWrap(True)  # Allow text wrapping
+        if max(map(len, self.box_text.splitlines())) > _WRAP_MIN_LINE_LENGTH:
+            text_label.setWordWrap(True)  # Allow text wrapping
         text_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         text_label.setStyleSheet("""
             QLabel {
@@ -108,6 +151,26 @@ class DynamicStringWidget(QWidget):
 
         return frame
 
+    def _make_checkbox_header(self, label_text: str, on_click) -> Tuple[QWidget, QCheckBox]:
+        """Create a column header: a bold label above a centered select-all checkbox"""
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(5)
+
+        label = QLabel(label_text)
+        label.setAlignment(Qt.AlignCenter)
+        label.setFont(_HEADER_FONT)
+        layout.addWidget(label)
+
+        # Checkbox (centered by the layout)
+        checkbox = QCheckBox()
+        checkbox.setTristate(False)
+        checkbox.clicked.connect(on_click)
+        layout.addWidget(checkbox, 0, Qt.AlignHCenter)
+
+        return container, checkbox
+
     def create_table_layout(self) -> QFrame:
         """Create a table-like layout with headers and radio buttons"""
         frame = QFrame()
@@ -122,148 +185,112 @@ class DynamicStringWidget(QWidget):
         # STRING COLUMN HEADER
         string_header = QLabel("Duplicate API Name")
         string_header.setAlignment(Qt.AlignLeft)
-        font = QFont()
-        font.setBold(True)
-        font.setPointSize(11)
-        string_header.setFont(font)
+        string_header.setFont(_HEADER_FONT)
         grid_layout.addWidget(string_header, 0, 0)
 
-        # GUI column header
-        gui_container = QWidget()
-        gui_layout = QVBoxLayout(gui_container)
-        gui_layout.setContentsMargins(0, 0, 0, 0)
-        gui_layout.setSpacing(5)
-
-        # GUI label
-        gui_label = QLabel("GUI")
-        gui_label.setAlignment(Qt.AlignCenter)
-        gui_label.setFont(font)
-        gui_layout.addWidget(gui_label)
-
-        # GUI checkbox (centered)
-        gui_checkbox_container = QWidget()
-        gui_checkbox_layout = QHBoxLayout(gui_checkbox_container)
-        gui_checkbox_layout.setContentsMargins(0, 0, 0, 0)
-        gui_checkbox_layout.addStretch()
-
-        self.gui_checkbox = QCheckBox()
-        self.gui_checkbox.setTristate(False)
-        self.gui_checkbox.clicked.connect(self.on_gui_checkbox_clicked)
-        gui_checkbox_layout.addWidget(self.gui_checkbox)
-        gui_checkbox_layout.addStretch()
-
-        gui_layout.addWidget(gui_checkbox_container)
+        # GUI and Custom column headers
+        gui_container, self.gui_checkbox = self._make_checkbox_header(
+            "GUI", self.on_gui_checkbox_clicked)
         grid_layout.addWidget(gui_container, 0, 1)
 
-        # Custom column header
-        custom_container = QWidget()
-        custom_layout = QVBoxLayout(custom_container)
-        custom_layout.setContentsMargins(0, 0, 0, 0)
-        custom_layout.setSpacing(5)
-
-        # Custom label
-        custom_label = QLabel("Custom")
-        custom_label.setAlignment(Qt.AlignCenter)
-        custom_label.setFont(font)
-        custom_layout.addWidget(custom_label)
-
-        # Custom checkbox (centered)
-        custom_checkbox_container = QWidget()
-        custom_checkbox_layout = QHBoxLayout(custom_checkbox_container)
-        custom_checkbox_layout.setContentsMargins(0, 0, 0, 0)
-        custom_checkbox_layout.addStretch()
-
-        self.custom_checkbox = QCheckBox()
-        self.custom_checkbox.setTristate(False)
-        self.custom_checkbox.clicked.connect(self.on_custom_checkbox_clicked)
-        custom_checkbox_layout.addWidget(self.custom_checkbox)
-        custom_checkbox_layout.addStretch()
-
-        custom_layout.addWidget(custom_checkbox_container)
+        custom_container, self.custom_checkbox = self._make_checkbox_header(
+            "Custom", self.on_custom_checkbox_clicked)
         grid_layout.addWidget(custom_container, 0, 2)
 
-        # Add rows for each string
-        for i, string_item in enumerate(self.string_list, 1):
-            row = i  # Start from row 1 (row 0 is headers)
-
-            # String label
-            string_label = QLabel(string_item)
-            string_label.setStyleSheet("QLabel { font-size: 10pt; }")
-            grid_layout.addWidget(string_label, row, 0)
-
-            # Create button group for this string item
-            button_group = QButtonGroup(self)
-
-            # GUI radio button (centered)
-            gui_radio = QRadioButton()
-            button_group.addButton(gui_radio, 0)
-
-            # Center the radio button
-            gui_radio_container = QWidget()
-            gui_radio_layout = QHBoxLayout(gui_radio_container)
-            gui_radio_layout.setContentsMargins(0, 0, 0, 0)
-            gui_radio_layout.addStretch()
-            gui_radio_layout.addWidget(gui_radio)
-            gui_radio_layout.addStretch()
-            grid_layout.addWidget(gui_radio_container, row, 1)
-
-            # Custom radio button (centered)
-            custom_radio = QRadioButton()
-            button_group.addButton(custom_radio, 1)
-
-            # Center the radio button
-            custom_radio_container = QWidget()
-            custom_radio_layout = QHBoxLayout(custom_radio_container)
-            custom_radio_layout.setContentsMargins(0, 0, 0, 0)
-            custom_radio_layout.addStretch()
-            custom_radio_layout.addWidget(custom_radio)
-            custom_radio_layout.addStretch()
-            grid_layout.addWidget(custom_radio_container, row, 2)
-
-            # Store the button group with the associated string
-            self.button_groups.append((string_item, button_group))
+        # Rows live in a model; the view only paints the rows that are visible
+        self.model = ChoiceTableModel(self.string_list, self)
+
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+        self.table_view.setItemDelegate(RadioDelegate(self.table_view))
+        self.table_view.horizontalHeader().hide()
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table_view.verticalHeader().hide()
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(_ROW_HEIGHT)
+        self.table_view.setShowGrid(False)
+        self.table_view.setFrameStyle(QFrame.NoFrame)
+        self.table_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_view.setFocusPolicy(Qt.NoFocus)
+
+        # Strings are shown at 10pt, as the per-row labels were
+        row_font = self.table_view.font()
+        row_font.setPointSize(10)
+        self.table_view.setFont(row_font)
+
+        # Equal column stretch keeps the header widgets over the view's columns
+        for column in range(3):
+            grid_layout.setColumnStretch(column, 1)
+        grid_layout.addWidget(self.table_view, 1, 0, 1, 3)
 
         return frame
 
+    def _fit_table_to_rows(self):
+        """Size the table for the current row count"""
+        row_count = len(self.string_list)
+        if row_count <= _MAX_UNSCROLLED_ROWS:
+            show_all_rows(self.table_view, row_count, _ROW_HEIGHT)
+            self.main_layout.setStretchFactor(self.table_frame, 0)
+        else:
+            # Long lists: the table takes the spare height and scrolls
+            self.table_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+            self.table_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+            self.table_view.setMinimumHeight(0)
+            self.table_view.setMaximumHeight(_QWIDGETSIZE_MAX)
+            self.main_layout.setStretchFactor(self.table_frame, 1)
+
+    @Slot(list)
+    def _on_list_ready(self, string_list: List[str]):
+        """Show a list delivered by a StringListProvider"""
+        self.string_list = string_list
+        self.model.set_strings(string_list)
+        self.gui_checkbox.setChecked(False)
+        self.custom_checkbox.setChecked(False)
+        self._fit_table_to_rows()
+
+    @Slot(str)
+    def _on_list_failed(self, message: str):
+        """Tell the user the list could not be loaded; the table stays empty"""
+        QMessageBox.warning(
+            self,
+            "Load Failed",
+            f"The string list could not be loaded:\n{message}",
+            QMessageBox.Ok
+        )
+
+    @Slot()
     def on_gui_checkbox_clicked(self):
         """Handle GUI checkbox click - auto-switch behavior"""
         if self.gui_checkbox.isChecked():
             # Select all GUI radios
-            for _, bg in self.button_groups:
-                bg.button(0).setChecked(True)
+            self.model.set_all_choices(0)
             # Uncheck Custom
             self.custom_checkbox.setChecked(False)
         else:
             # GUI was unchecked â†’ auto-select all Custom
-            for _, bg in self.button_groups:
-                bg.button(1).setChecked(True)
+            self.model.set_all_choices(1)
             # Check Custom checkbox
             self.custom_checkbox.setChecked(True)
 
+    @Slot()
     def on_custom_checkbox_clicked(self):
         """Handle Custom checkbox click - auto-switch behavior"""
         if self.custom_checkbox.isChecked():
             # Select all Custom radios
-            for _, bg in self.button_groups:
-                bg.button(1).setChecked(True)
+            self.model.set_all_choices(1)
             # Uncheck GUI
             self.gui_checkbox.setChecked(False)
         else:
             # Custom was unchecked â†’ auto-select all GUI
-            for _, bg in self.button_groups:
-                bg.button(0).setChecked(True)
+            self.model.set_all_choices(0)
             self.gui_checkbox.setChecked(True)
 
+    @Slot()
     def on_ok_clicked(self):
         """Handle OK button click with validation"""
-        # Check if all selections are made
-        unselected_items = []
-        for string_item, button_group in self.button_groups:
-            if button_group.checkedId() == -1:  # -1 means no selection
-                unselected_items.append(string_item)
-
-        # If there are unselected items, show warning and return
-        if unselected_items:
+        # If any selection is missing (-1), show warning and return
+        if -1 in self.model.choices:
             QMessageBox.warning(
                 self, 
                 "Incomplete Selection", 
@@ -279,13 +306,9 @@ class DynamicStringWidget(QWidget):
 
     def get_result(self) -> List[Tuple[str, str]]:
         """Get the current selection as a list of tuples"""
-        result = []
-        for string_item, button_group in self.button_groups:
-            # Get the checked button ID (0 for GUI, 1 for Custom)
-            checked_id = button_group.checkedId()
-            choice = "GUI" if checked_id == 0 else "Custom"
-            result.append((string_item, choice))
-        return result
+        # Choice 0 is GUI; 1 and no selection (-1) both index "Custom"
+        return [(string_item, _CHOICE_STR[choice])
+                for string_item, choice in zip(self.model.strings, self.model.choices)]
 
 
 def main():